@@ -4,8 +4,10 @@
 EmTechScan – Classical OCR (External Engines: GOCR / Cuneiform)
 -------------------------------------------------
 - Uses external CLI OCR engines (gocr or cuneiform) instead of template/ML
-- Supports image and PDF input
+- Supports image and multi-page PDF input (pages are OCR'd concurrently)
 - Saves recognized text to Word (.docx) or Text (.txt)
+- Caches OCR text under ~/.cache/emtechscan (oldest entries are evicted
+  past DISK_CACHE_MAX_ENTRIES; delete the directory to clear it)
 """
 
 import os
@@ -20,93 +22,545 @@ from pdf2image import convert_from_path
 import subprocess
 import tempfile
 import shutil
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 
 # ...existing code...
 
+# OCR results are cached by preprocessed image content + engine + language
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "emtechscan")
+MEMORY_CACHE_SIZE = 128
+DISK_CACHE_MAX_ENTRIES = 1000
+
+PDF_DPI = 200
+
+# Larger inputs are downscaled to this long edge before OCR; gocr in
+# particular slows superlinearly with area and gains nothing past ~300 DPI
+MAX_LONG_EDGE = 2000
+
+# Preprocessing shortcuts for inputs that are already clean
+BINARY_FRACTION = 0.98   # share of pure black/white pixels to skip thresholding
+MIN_DESKEW_ANGLE = 0.5   # degrees; smaller skews are not worth a warp
+MIN_INK_FRACTION = 0.001 # below this share of dark pixels the page is blank
+
+# White margin kept around the text when cropping to the content bbox
+CROP_PADDING = 10
+# Ink contours smaller than this (px^2) are noise, not text
+MIN_SPECK_AREA = 4
+
+# Concurrent multi-page OCR leaves a core free for the Tk thread and the OS,
+# and runs the engines at lowered priority
+OCR_WORKERS = max(1, (os.cpu_count() or 1) - 1)
+ENGINE_NICE = 10
+
+# Minimum white gap between pages when several are stitched into one
+# cuneiform run; the gap also grows to the tallest page's height
+PAGE_SEPARATOR_HEIGHT = 400
+# Pages per stitched cuneiform run
+STITCH_BATCH_PAGES = 4
+
+
+def load_pdf_pages(path, first_page=None, last_page=None):
+    """
+    Rasterize only the requested PDF pages (1-based, inclusive).
+    Poppler renders them in parallel; PPM output skips its PNG encode.
+    """
+    return convert_from_path(path, dpi=PDF_DPI,
+                             first_page=first_page, last_page=last_page,
+                             thread_count=os.cpu_count() or 1, fmt='ppm')
+
+
 class ExternalOCREngine:
     """
     Wrap calls to external OCR engines (gocr or cuneiform).
-    The class preprocesses/deskews the image, writes a temp PNG,
-    invokes the selected engine and returns the extracted text.
+    The class preprocesses/deskews the image, pipes it to gocr as PGM
+    (or writes a temp PGM for cuneiform), invokes the selected engine
+    and returns the extracted text.
+    Results are cached in memory and under CACHE_DIR, keyed by a hash
+    of the preprocessed image, so repeat runs skip the subprocess.
     """
-    def __init__(self, engine='gocr', language='eng'):
+    def __init__(self, engine='gocr', language='eng', cache_dir=CACHE_DIR,
+                 max_long_edge=MAX_LONG_EDGE):
         self.engine = engine
         self.language = language
+        self.max_long_edge = max_long_edge
+        self.cache_dir = cache_dir
+        self._memory_cache = OrderedDict()
+        # CLAHE objects keep internal buffers, so each thread gets its own
+        self._local = threading.local()
 
     def engine_available(self):
         return shutil.which(self.engine) is not None
 
-    def _preprocess_image(self, img_path):
-        img = cv2.imread(img_path, cv2.IMREAD_GRAYSCALE)
+    def _clahe(self):
+        clahe = getattr(self._local, "clahe", None)
+        if clahe is None:
+            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+            self._local.clahe = clahe
+        return clahe
+
+    def _preprocess_image(self, source):
+        # source is an image path or an already-loaded page (e.g. from a PDF)
+        if isinstance(source, Image.Image):
+            img = np.asarray(source.convert("L"))
+        else:
+            img = cv2.imread(source, cv2.IMREAD_GRAYSCALE)
         if img is None:
             raise ValueError("Invalid image file")
 
-        img = cv2.GaussianBlur(img, (3, 3), 0)
-        _, thresh = cv2.threshold(img, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        # Check before downscaling: INTER_AREA would turn stroke edges gray
+        binary = self._is_binary(img)
+
+        if self.max_long_edge and self.max_long_edge > 0:
+            scale = min(1.0, self.max_long_edge / max(img.shape[:2]))
+            if scale < 1.0:
+                # Nearest-neighbour keeps a clean binary scan two-level
+                interp = cv2.INTER_NEAREST if binary else cv2.INTER_AREA
+                img = cv2.resize(img, None, fx=scale, fy=scale,
+                                 interpolation=interp)
+
+        if binary:
+            # Already a clean scan: just snap the few stray grays
+            _, thresh = cv2.threshold(img, 127, 255, cv2.THRESH_BINARY)
+        else:
+            # Local contrast equalization + adaptive threshold copes with
+            # shadows and lighting gradients that a global Otsu can't
+            img = self._clahe().apply(img)
+            img = cv2.GaussianBlur(img, (3, 3), 0)
+            thresh = cv2.adaptiveThreshold(img, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                                           cv2.THRESH_BINARY, 31, 10)
+            # CLAHE amplifies flat-background sensor noise, which the
+            # adaptive threshold turns into speckle "ink"; clear it so it
+            # can't defeat the blank check, the crop or the skew estimate
+            thresh = cv2.medianBlur(thresh, 3)
+
+        # Blank or near-blank page: nothing to crop or deskew, and a
+        # handful of specks would only yield a meaningless angle
+        if self._is_blank(thresh):
+            return thresh
+        (h, w) = thresh.shape[:2]
+
+        pts = self._ink_points(thresh)
+        if pts is None:
+            return thresh
+
+        # Crop to the content bbox (plus padding) so the warp and the
+        # engine only see the part of the page that has text on it
+        x, y, bw, bh = cv2.boundingRect(pts)
+        x0, y0 = max(0, x - CROP_PADDING), max(0, y - CROP_PADDING)
+        x1, y1 = min(w, x + bw + CROP_PADDING), min(h, y + bh + CROP_PADDING)
+        thresh = thresh[y0:y1, x0:x1]
 
         # Deskew
-        coords = np.column_stack(np.where(thresh > 0))
-        if len(coords) > 0:
-            angle = cv2.minAreaRect(coords)[-1]
-            if angle < -45:
-                angle = -(90 + angle)
-            else:
-                angle = -angle
+        angle = self._skew_angle(pts)
+        if abs(angle) >= MIN_DESKEW_ANGLE:
             (h, w) = thresh.shape[:2]
-            M = cv2.getRotationMatrix2D((w // 2, h // 2), angle, 1.0)
-            thresh = cv2.warpAffine(thresh, M, (w, h),
-                                    flags=cv2.INTER_CUBIC,
-                                    borderMode=cv2.BORDER_REPLICATE)
+            M = cv2.getRotationMatrix2D((w / 2, h / 2), angle, 1.0)
+            # The crop is tight, so grow the canvas to fit the rotated
+            # content instead of clipping its corners
+            cos, sin = abs(M[0, 0]), abs(M[0, 1])
+            nw, nh = int(h * sin + w * cos + 0.5), int(h * cos + w * sin + 0.5)
+            M[0, 2] += (nw - w) / 2
+            M[1, 2] += (nh - h) / 2
+            # Bilinear is plenty for a two-level image; re-binarize the
+            # gray edge pixels it leaves behind
+            thresh = cv2.warpAffine(thresh, M, (nw, nh),
+                                    flags=cv2.INTER_LINEAR,
+                                    borderMode=cv2.BORDER_CONSTANT,
+                                    borderValue=255)
+            _, thresh = cv2.threshold(thresh, 127, 255, cv2.THRESH_BINARY)
         return thresh
 
-    def _save_temp_png(self, img_path):
-        thresh = self._preprocess_image(img_path)
-        fd, tmp = tempfile.mkstemp(suffix='.png')
-        os.close(fd)
-        cv2.imwrite(tmp, thresh)
+    def _is_blank(self, thresh):
+        """True if under MIN_INK_FRACTION of a thresholded image is ink."""
+        (h, w) = thresh.shape[:2]
+        n_ink = h * w - cv2.countNonZero(thresh)
+        return n_ink < MIN_INK_FRACTION * h * w
+
+    def _is_binary(self, img):
+        """Cheap bimodality check on a 1/8-scale thumbnail."""
+        # Nearest-neighbour keeps pixel values intact; INTER_AREA would
+        # average edges into grays and defeat the test.
+        small = img
+        # cv2.resize rejects an empty target, so tiny images are used as-is
+        if min(img.shape[:2]) >= 8:
+            small = cv2.resize(img, (0, 0), fx=0.125, fy=0.125,
+                               interpolation=cv2.INTER_NEAREST)
+        # Count directly rather than via calcHist, whose output shape
+        # differs between OpenCV 4 ((256, 1)) and 5 ((256,))
+        n_pure = np.count_nonzero((small == 0) | (small == 255))
+        return n_pure / small.size > BINARY_FRACTION
+
+    def _ink_points(self, thresh):
+        """
+        Return the outer contour points of the dark (ink) pixels as an
+        (N, 2) array of (x, y), or None if there is no text.
+        """
+        # Text is black on white after thresholding; contour the ink
+        ink = cv2.bitwise_not(thresh)
+        contours, _ = cv2.findContours(ink, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        # Ignore leftover specks; they would stretch the bbox to the page
+        # edges and pull the skew angle towards zero
+        contours = [c for c in contours if cv2.contourArea(c) >= MIN_SPECK_AREA]
+        if not contours:
+            return None
+        # Boundary points only, instead of every foreground pixel
+        return np.vstack(contours).reshape(-1, 2)
+
+    def _skew_angle(self, pts):
+        """Text skew angle in degrees from the ink contour points."""
+        angle = cv2.minAreaRect(pts)[-1]
+        # minAreaRect's range differs across OpenCV versions; fold to (-45, 45]
+        if angle > 45:
+            angle -= 90
+        elif angle <= -45:
+            angle += 90
+        return angle
+
+    def _save_temp_pgm(self, thresh):
+        # Raw PGM instead of PNG: no zlib encode here or decode in the engine
+        fd, tmp = tempfile.mkstemp(suffix='.pgm')
+        # Write through the fd mkstemp already opened instead of reopening
+        with os.fdopen(fd, 'wb') as f:
+            f.write(self._to_pgm(thresh))
         return tmp
 
-    def recognize(self, img_path):
+    def _cache_key(self, thresh):
+        h = hashlib.sha256(thresh.tobytes())
+        h.update(repr(thresh.shape).encode())
+        h.update(self.engine.encode())
+        h.update(self.language.encode())
+        return h.hexdigest()
+
+    def _cache_get(self, key):
+        if key in self._memory_cache:
+            self._memory_cache.move_to_end(key)
+            return self._memory_cache[key]
+        path = os.path.join(self.cache_dir, f"{key}.txt")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except OSError:
+            return None
+        # Refresh the mtime so eviction drops the least recently used entries
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._remember(key, text)
+        return text
+
+    def _cache_put(self, key, text):
+        self._remember(key, text)
+        # Write to a temp file and rename so readers never see a partial entry
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        except OSError:
+            # The disk cache is best-effort; OCR still succeeded
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, os.path.join(self.cache_dir, f"{key}.txt"))
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+        self._prune_disk_cache()
+
+    def _prune_disk_cache(self):
+        """Evict the oldest entries once the disk cache exceeds its cap."""
+        try:
+            entries = [(e.stat().st_mtime, e.path) for e in os.scandir(self.cache_dir)
+                       if e.is_file() and e.name.endswith(".txt")]
+        except OSError:
+            # Another instance may be pruning at the same time; try next write
+            return
+        if len(entries) <= DISK_CACHE_MAX_ENTRIES:
+            return
+        entries.sort()
+        for _, path in entries[:len(entries) - DISK_CACHE_MAX_ENTRIES]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _remember(self, key, text):
+        self._memory_cache[key] = text
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
+
+    def _to_pgm(self, thresh):
+        # Raw binary PGM: a tiny header plus the pixel buffer, no compression
+        h, w = thresh.shape[:2]
+        header = f"P5\n{w} {h}\n255\n".encode()
+        return header + np.ascontiguousarray(thresh, dtype=np.uint8).tobytes()
+
+    @contextmanager
+    def _cuneiform_run(self, thresh):
         """
-        Recognize text using the chosen external engine.
-        Returns recognized text as a string.
+        Yield (cmd, out_path) for one cuneiform run. The input image and
+        the output file are temp files, removed on exit.
         """
-        if not self.engine_available():
-            raise FileNotFoundError(f"Engine '{self.engine}' not found in PATH. Install it or choose another engine.")
-
-        tmp_img = self._save_temp_png(img_path)
+        # cuneiform reads a file and writes its text to another file
+        tmp_img = self._save_temp_pgm(thresh)
+        out_path = None
         try:
-            if self.engine == "gocr":
-                # gocr outputs to stdout; pass the image file path
-                proc = subprocess.run([self.engine, tmp_img],
-                                      stdout=subprocess.PIPE,
-                                      stderr=subprocess.PIPE,
-                                      text=True)
-                text = proc.stdout.strip()
-                # gocr may print warnings on stderr; ignore or include if helpful
-            elif self.engine == "cuneiform":
-                # cuneiform typically writes to a file; create a temp output file
-                out_fd, out_path = tempfile.mkstemp(suffix='.txt')
-                os.close(out_fd)
-                cmd = [self.engine, "-l", self.language, "-f", "text", "-o", out_path, tmp_img]
-                proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-                # Read output file contents
-                try:
-                    with open(out_path, "r", encoding="utf-8", errors="ignore") as f:
-                        text = f.read().strip()
-                finally:
-                    try:
-                        os.remove(out_path)
-                    except OSError:
-                        pass
-            else:
-                raise ValueError(f"Unsupported engine: {self.engine}")
+            out_fd, out_path = tempfile.mkstemp(suffix='.txt')
+            os.close(out_fd)
+            yield [self.engine, "-l", self.language, "-f", "text", "-o", out_path, tmp_img], out_path
         finally:
+            for path in (out_path, tmp_img):
+                if path is None:
+                    continue
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _read_output(self, out_path):
+        with open(out_path, "r", encoding="utf-8", errors="ignore") as f:
+            return f.read().strip()
+
+    def _run_engine(self, thresh):
+        """
+        Invoke the external engine on a preprocessed image.
+        Returns (text, returncode).
+        """
+        if self.engine == "gocr":
+            # gocr reads PGM from stdin with "-", so no temp file is needed
+            proc = subprocess.run([self.engine, "-"],
+                                  input=self._to_pgm(thresh),
+                                  stdout=subprocess.PIPE,
+                                  stderr=subprocess.PIPE)
+            text = proc.stdout.decode("utf-8", errors="ignore").strip()
+            # gocr may print warnings on stderr; ignore or include if helpful
+        elif self.engine == "cuneiform":
+            with self._cuneiform_run(thresh) as (cmd, out_path):
+                proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+                text = self._read_output(out_path)
+        else:
+            raise ValueError(f"Unsupported engine: {self.engine}")
+
+        return text, proc.returncode
+
+    async def _spawn_engine(self, *cmd, **kwargs):
+        """
+        Start an engine process for the concurrent path: one OpenMP thread
+        each (the pool already fills the cores) and below-normal priority.
+        """
+        env = dict(os.environ, OMP_THREAD_LIMIT="1")
+        if os.name == "nt":
+            kwargs["creationflags"] = subprocess.BELOW_NORMAL_PRIORITY_CLASS
+        proc = await asyncio.create_subprocess_exec(*cmd, env=env, **kwargs)
+        # Renice after spawn rather than via preexec_fn, which isn't safe
+        # to use from a multi-threaded process like this one
+        if hasattr(os, "setpriority"):
             try:
-                os.remove(tmp_img)
+                os.setpriority(os.PRIO_PROCESS, proc.pid, ENGINE_NICE)
             except OSError:
                 pass
+        return proc
+
+    async def _run_engine_async(self, thresh):
+        """
+        Same as _run_engine, but awaits the subprocess so several
+        pages can be recognized at once. Returns (text, returncode).
+        """
+        if self.engine == "gocr":
+            proc = await self._spawn_engine(
+                self.engine, "-",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE)
+            stdout, _ = await proc.communicate(self._to_pgm(thresh))
+            text = stdout.decode("utf-8", errors="ignore").strip()
+        elif self.engine == "cuneiform":
+            with self._cuneiform_run(thresh) as (cmd, out_path):
+                proc = await self._spawn_engine(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE)
+                await proc.communicate()
+                text = self._read_output(out_path)
+        else:
+            raise ValueError(f"Unsupported engine: {self.engine}")
+
+        return text, proc.returncode
+
+    async def _recognize_thresh_async(self, thresh):
+        # Blank and cover pages have nothing to read; skip the engine
+        if self._is_blank(thresh):
+            return ""
+        key = self._cache_key(thresh)
+        text = self._cache_get(key)
+        if text is not None:
+            return text
+
+        text, returncode = await self._run_engine_async(thresh)
+        # Don't cache output from a failed run
+        if returncode == 0:
+            self._cache_put(key, text)
+        return text
+
+    async def recognize_async(self, source):
+        """
+        Async variant of recognize() for an image path or a PIL page.
+        Preprocessing runs in a worker thread so the event loop stays free.
+        """
+        thresh = await asyncio.to_thread(self._preprocess_image, source)
+        return await self._recognize_thresh_async(thresh)
+
+    def _stitch_pages(self, threshes):
+        """Stack preprocessed pages vertically, separated by white strips."""
+        width = max(t.shape[1] for t in threshes)
+        # A gap as tall as the tallest page is longer than any gap that can
+        # occur inside a page, so the separators stay distinguishable
+        gap_height = max(PAGE_SEPARATOR_HEIGHT, max(t.shape[0] for t in threshes))
+        gap = np.full((gap_height, width), 255, dtype=np.uint8)
+        rows = []
+        for t in threshes:
+            if rows:
+                rows.append(gap)
+            rows.append(cv2.copyMakeBorder(t, 0, 0, 0, width - t.shape[1],
+                                           cv2.BORDER_CONSTANT, value=255))
+        return np.vstack(rows)
+
+    def _split_pages(self, text, n):
+        """
+        Split stitched output into n pages at its n-1 longest runs of blank
+        lines. Returns None unless those runs are clearly longer than every
+        other blank run and each page got some text.
+        """
+        lines = text.split("\n")
+        runs = []   # (first line, length) of each blank-line run
+        i = 0
+        while i < len(lines):
+            if lines[i].strip():
+                i += 1
+                continue
+            j = i
+            while j < len(lines) and not lines[j].strip():
+                j += 1
+            runs.append((i, j - i))
+            i = j
+        if len(runs) < n - 1:
+            return None
+
+        ranked = sorted(runs, key=lambda run: run[1], reverse=True)
+        seps = ranked[:n - 1]
+        # Separators must be at least twice as long as any in-page gap
+        if len(ranked) > n - 1 and seps and ranked[n - 1][1] * 2 >= seps[-1][1]:
+            return None
+
+        chunks, start = [], 0
+        for first, length in sorted(seps):
+            chunks.append("\n".join(lines[start:first]).strip())
+            start = first + length
+        chunks.append("\n".join(lines[start:]).strip())
+        # Blank pages are never stitched, so every page must have text
+        if not all(chunks):
+            return None
+        return chunks
+
+    async def _recognize_pages_async(self, pages):
+        sem = asyncio.Semaphore(OCR_WORKERS)
+
+        if self.engine != "cuneiform":
+            # Preprocess and OCR each page under the same slot so engines
+            # start as soon as their page is ready
+            async def one(page):
+                async with sem:
+                    return await self.recognize_async(page)
+
+            return await asyncio.gather(*(one(page) for page in pages))
+
+        async def preprocess(page):
+            async with sem:
+                return await asyncio.to_thread(self._preprocess_image, page)
+
+        threshes = await asyncio.gather(*(preprocess(page) for page in pages))
+        texts = [None] * len(threshes)
+        keys = [None] * len(threshes)
+        pending = []
+        for i, thresh in enumerate(threshes):
+            if self._is_blank(thresh):
+                # Nothing to read; keep blank pages out of the engine entirely
+                texts[i] = ""
+            else:
+                keys[i] = self._cache_key(thresh)
+                texts[i] = self._cache_get(keys[i])
+                if texts[i] is None:
+                    pending.append(i)
+
+        async def run(i):
+            async with sem:
+                texts[i] = await self._recognize_thresh_async(threshes[i])
+
+        async def run_batch(batch):
+            if len(batch) == 1:
+                await run(batch[0])
+                return
+            # Cuneiform's startup cost dominates, so OCR the batch in one run
+            async with sem:
+                stitched = self._stitch_pages([threshes[i] for i in batch])
+                text, returncode = await self._run_engine_async(stitched)
+            chunks = self._split_pages(text, len(batch)) if returncode == 0 else None
+            if chunks is None:
+                # Page boundaries couldn't be recovered; one run per page
+                await asyncio.gather(*(run(i) for i in batch))
+                return
+            # The split is a heuristic: keep it for this session's
+            # repeat runs, but never persist it to the disk cache
+            for i, chunk in zip(batch, chunks):
+                texts[i] = chunk
+                self._remember(keys[i], chunk)
+
+        # Fixed-size batches bound the stitched image's height and the
+        # cost of a failed split
+        batches = [pending[n:n + STITCH_BATCH_PAGES]
+                   for n in range(0, len(pending), STITCH_BATCH_PAGES)]
+        await asyncio.gather(*(run_batch(batch) for batch in batches))
+        return texts
+
+    def recognize_pages(self, pages):
+        """
+        Recognize a list of PIL pages (e.g. from convert_from_path)
+        concurrently, using at most OCR_WORKERS engine processes.
+        Returns a list of strings in page order.
+        """
+        if not self.engine_available():
+            raise FileNotFoundError(f"Engine '{self.engine}' not found in PATH. Install it or choose another engine.")
+
+        return asyncio.run(self._recognize_pages_async(pages))
 
+    def recognize(self, img_path):
+        """
+        Recognize text using the chosen external engine.
+        Returns recognized text as a string.
+        """
+        if not self.engine_available():
+            raise FileNotFoundError(f"Engine '{self.engine}' not found in PATH. Install it or choose another engine.")
+
+        thresh = self._preprocess_image(img_path)
+        if self._is_blank(thresh):
+            return ""
+        key = self._cache_key(thresh)
+        text = self._cache_get(key)
+        if text is not None:
+            return text
+
+        text, returncode = self._run_engine(thresh)
+        # Don't cache output from a failed run
+        if returncode == 0:
+            self._cache_put(key, text)
         return text
 
 # ...existing code...
@@ -133,7 +587,8 @@ class OCRApp:
 
         ttk.Button(frm, text="(No Training Required) Select Folder (optional)", command=self.select_training).grid(row=2, column=0, sticky="ew", pady=4)
         ttk.Button(frm, text="Select Image/PDF", command=self.select_image).grid(row=2, column=1, sticky="ew", pady=4)
-        ttk.Button(frm, text="Run OCR", command=self.run_ocr).grid(row=2, column=2, sticky="ew", pady=4)
+        self.run_button = ttk.Button(frm, text="Run OCR", command=self.run_ocr)
+        self.run_button.grid(row=2, column=2, sticky="ew", pady=4)
         ttk.Button(frm, text="Train (N/A)", command=self.train_ml).grid(row=2, column=3, sticky="ew", pady=4)
 
         ttk.Label(frm, text="Recognition Mode:").grid(row=3, column=0, sticky="w", pady=3)
@@ -155,11 +610,25 @@ class OCRApp:
 
         ttk.Button(frm, text="Save Output", command=self.save_output).grid(row=4, column=2, columnspan=2, sticky="ew", pady=5)
 
+        ttk.Label(frm, text="PDF pages (first / last):").grid(row=5, column=0, sticky="w", pady=3)
+        self.first_page_var = tk.StringVar(value="1")
+        ttk.Entry(frm, textvariable=self.first_page_var).grid(row=5, column=1, sticky="ew", pady=3)
+        # Blank last page means "through the end of the document"
+        self.last_page_var = tk.StringVar(value="")
+        ttk.Entry(frm, textvariable=self.last_page_var).grid(row=5, column=2, sticky="ew", pady=3)
+
+        ttk.Label(frm, text="Max long edge (px, 0 = off):").grid(row=6, column=0, sticky="w", pady=3)
+        self.long_edge_var = tk.StringVar(value=str(MAX_LONG_EDGE))
+        ttk.Entry(frm, textvariable=self.long_edge_var).grid(row=6, column=1, sticky="ew", pady=3)
+
         self.status = ttk.Label(frm, text="Status: Ready")
-        self.status.grid(row=5, column=0, columnspan=4, sticky="w", pady=3)
+        self.status.grid(row=7, column=0, columnspan=3, sticky="w", pady=3)
+
+        self.progress = ttk.Progressbar(frm, mode="indeterminate")
+        self.progress.grid(row=7, column=3, sticky="ew", pady=3)
 
         self.text_box = tk.Text(frm, wrap="word", width=70, height=12)
-        self.text_box.grid(row=6, column=0, columnspan=4, pady=5)
+        self.text_box.grid(row=8, column=0, columnspan=4, pady=5)
 
         frm.columnconfigure((0, 1, 2, 3), weight=1)
 
@@ -176,16 +645,15 @@ class OCRApp:
             return
         self.image_path = path
         if path.lower().endswith(".pdf"):
-            pages = convert_from_path(path)
-            temp = "page_temp.png"
-            pages[0].save(temp, "PNG")
-            path = temp
-            self.image_path = path
-        self.show_preview(path)
+            # Only rasterize the first page for the preview
+            pages = load_pdf_pages(path, first_page=1, last_page=1)
+            self.show_preview(pages[0])
+        else:
+            self.show_preview(path)
         self.status.config(text=f"Loaded: {os.path.basename(path)}")
 
-    def show_preview(self, path):
-        img = Image.open(path)
+    def show_preview(self, source):
+        img = source if isinstance(source, Image.Image) else Image.open(source)
         img.thumbnail((480, 360))
         self.tk_img = ImageTk.PhotoImage(img)
         self.canvas.create_image(0, 0, anchor="nw", image=self.tk_img)
@@ -194,6 +662,18 @@ class OCRApp:
         # Not applicable for external engines
         messagebox.showinfo("Not applicable", "Training is not applicable for external engines (gocr / cuneiform).")
 
+    def _page_range(self):
+        first = self.first_page_var.get().strip()
+        last = self.last_page_var.get().strip()
+        try:
+            first = int(first) if first else 1
+            last = int(last) if last else None
+        except ValueError:
+            raise ValueError("PDF page numbers must be whole numbers.")
+        if first < 1 or (last is not None and last < first):
+            raise ValueError("Invalid PDF page range.")
+        return first, last
+
     def run_ocr(self):
         if not self.image_path:
             messagebox.showwarning("No image", "Please select an image or PDF first.")
@@ -204,21 +684,61 @@ class OCRApp:
         self.ocr.engine = selected_engine
         self.ocr.language = selected_lang
 
+        long_edge = self.long_edge_var.get().strip()
         try:
-            if not self.ocr.engine_available():
-                messagebox.showerror("Engine not found", f"Selected engine '{selected_engine}' not found in PATH. Install it (e.g., sudo apt install gocr cuneiform) or choose another engine.")
-                return
+            self.ocr.max_long_edge = int(long_edge) if long_edge else 0
+        except ValueError:
+            messagebox.showerror("Error", "Max long edge must be a whole number of pixels.")
+            return
+
+        if not self.ocr.engine_available():
+            messagebox.showerror("Engine not found", f"Selected engine '{selected_engine}' not found in PATH. Install it (e.g., sudo apt install gocr cuneiform) or choose another engine.")
+            return
 
-            self.status.config(text=f"Running OCR with {selected_engine}...")
-            self.root.update()
+        page_range = None
+        if self.image_path.lower().endswith(".pdf"):
+            try:
+                page_range = self._page_range()
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
+                return
 
-            result = self.ocr.recognize(self.image_path)
-            self.result_text = result
-            self.text_box.delete("1.0", tk.END)
-            self.text_box.insert("1.0", result)
-            self.status.config(text=f"OCR complete ({selected_engine}). {len(result)} characters recognized.")
+        # OCR can take seconds; run it off the Tk thread so the UI stays live.
+        # The subprocesses release the GIL, so a thread is enough.
+        self.run_button.state(["disabled"])
+        self.progress.start(10)
+        self.status.config(text=f"Running OCR with {selected_engine}...")
+        threading.Thread(target=self._ocr_worker,
+                         args=(self.image_path, page_range),
+                         daemon=True).start()
+
+    def _ocr_worker(self, path, page_range):
+        # Runs in a background thread: no Tk calls here except root.after
+        try:
+            if page_range is not None:
+                first, last = page_range
+                pages = load_pdf_pages(path, first_page=first, last_page=last)
+                texts = self.ocr.recognize_pages(pages)
+                result = "\n\n".join(f"--- Page {n} ---\n\n{text}"
+                                      for n, text in enumerate(texts, first))
+            else:
+                result = self.ocr.recognize(path)
         except Exception as e:
-            messagebox.showerror("Error", str(e))
+            result = e
+        self.root.after(0, self._ocr_done, result)
+
+    def _ocr_done(self, result):
+        self.progress.stop()
+        self.run_button.state(["!disabled"])
+        if isinstance(result, Exception):
+            self.status.config(text="Status: OCR failed")
+            messagebox.showerror("Error", str(result))
+            return
+
+        self.result_text = result
+        self.text_box.delete("1.0", tk.END)
+        self.text_box.insert("1.0", result)
+        self.status.config(text=f"OCR complete ({self.ocr.engine}). {len(result)} characters recognized.")
 
     def save_output(self):
         if not self.result_text.strip():
@@ -14,13 +14,135 @@ Dependencies:
 
 import os
 import random
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image, ImageDraw, ImageFont
 import numpy as np
+import cv2
+
+# Bump whenever _render_glyph's output changes so cached glyphs are rebuilt
+GLYPH_CACHE_VERSION = 1
+
+
+def _init_worker():
+    # Forked workers inherit the parent's RNG state; reseed from OS entropy
+    # so each process produces its own augmentations.
+    random.seed()
+    # One process per core already; keep OpenCV from spawning its own threads
+    cv2.setNumThreads(1)
+
+
+def _render_glyph(font, char, img_size):
+    """Draw a single character centred on a white img_size canvas."""
+    # Measure with getbbox (draw.textsize was removed in Pillow 10) and
+    # subtract the bearing so the ink, not the origin, is centred.
+    left, top, right, bottom = font.getbbox(char)
+    w, h = right - left, bottom - top
+    text_pos = ((img_size - w) / 2 - left, (img_size - h) / 2 - top)
+
+    glyph = Image.new("L", (img_size, img_size), color=255)
+    ImageDraw.Draw(glyph).text(text_pos, char, font=font, fill=0)
+    return np.array(glyph, dtype=np.uint8)
+
+
+def _load_glyphs(font_path, font_size, img_size, charset, cache_dir):
+    """
+    Return {char: base glyph array} for the charset, reusing glyphs
+    saved by earlier runs with the same font file, size and canvas.
+    """
+    try:
+        with open(font_path, "rb") as f:
+            font_hash = hashlib.md5(f.read()).hexdigest()[:12]
+    except OSError as e:
+        raise RuntimeError(f"Font not found or invalid: {font_path}\n{e}")
+    cache_path = os.path.join(
+        cache_dir,
+        f"glyphs_v{GLYPH_CACHE_VERSION}_{font_hash}_{font_size}_{img_size}.npz")
+
+    # Plain uint8 arrays only (allow_pickle=False), so a file planted in
+    # the cache directory can't run code when loaded
+    glyphs = {}
+    try:
+        with np.load(cache_path, allow_pickle=False) as data:
+            codes, stack = data["codes"], data["glyphs"]
+            if stack.dtype == np.uint8 and stack.shape[1:] == (img_size, img_size):
+                glyphs = {chr(int(code)): g for code, g in zip(codes, stack)}
+    except Exception:
+        # Best effort: a missing, truncated or incompatible file just
+        # means re-rendering
+        glyphs = {}
+
+    missing = [c for c in charset if c not in glyphs]
+    if missing:
+        try:
+            font = ImageFont.truetype(font_path, font_size)
+        except Exception as e:
+            raise RuntimeError(f"Font not found or invalid: {font_path}\n{e}")
+        for c in missing:
+            glyphs[c] = _render_glyph(font, c, img_size)
+
+        # Best-effort write; rename so a crashed run never leaves a torn file
+        tmp = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(tmp, "wb") as f:
+                np.savez(f, codes=np.array([ord(c) for c in glyphs], dtype=np.int64),
+                         glyphs=np.stack(list(glyphs.values())))
+            os.replace(tmp, cache_path)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    return {c: glyphs[c] for c in charset}
+
+
+def _render_char(char, glyph, samples_per_char, output_dir):
+    """Augment and save every sample of a single pre-rendered character."""
+    img_size = glyph.shape[0]
+    safe_char = char if char.isalnum() else f"sym_{ord(char)}"
+    center = (img_size / 2, img_size / 2)
+
+    # Scratch buffers, reused for every sample of this character.
+    # The noise sum is taken in uint16 so it saturates at 255 instead of wrapping.
+    rng = np.random.default_rng()
+    sample = np.empty((img_size, img_size), dtype=np.uint8)
+    summed = np.empty((img_size, img_size), dtype=np.uint16)
+
+    for i in range(samples_per_char):
+        # Augmentations: rotation and scale about the centre in one warp
+        angle = random.uniform(-5, 5)
+        scale = random.uniform(0.85, 1.15)
+        M = cv2.getRotationMatrix2D(center, angle, scale)
+        cv2.warpAffine(glyph, M, (img_size, img_size), dst=sample,
+                       flags=cv2.INTER_LINEAR, borderValue=255)
+
+        if random.random() < 0.5:
+            cv2.GaussianBlur(sample, (0, 0), random.uniform(0.7, 1.2), dst=sample)
+
+        if random.random() < 0.6:
+            # Draw the noise as uint8 (half the temporary of uint16) and
+            # widen only in the sum
+            np.add(sample, rng.integers(0, 20, size=sample.shape, dtype=np.uint8),
+                   out=summed, dtype=np.uint16)
+            np.minimum(summed, 255, out=summed)
+            np.copyto(sample, summed, casting="unsafe")
+
+        path = os.path.join(output_dir, f"{safe_char}_{i}.png")
+        # Fastest zlib level: these are throwaway training images.
+        # cv2.imwrite reports failure by returning False, not raising.
+        if not cv2.imwrite(path, sample, [cv2.IMWRITE_PNG_COMPRESSION, 1]):
+            raise OSError(f"Failed to write image: {path}")
+
+    return samples_per_char
+
 
 def generate_dataset(font_path="./fonts/arial.ttf",
                      output_dir="./train_data",
                      charset=None, img_size=128,
-                     font_size=100, samples_per_char=50):
+                     font_size=100, samples_per_char=50,
+                     max_workers=None, glyph_cache_dir="./.cache"):
 
     # Full ASCII set: letters, numbers, and printable symbols
     if charset is None:
@@ -33,45 +155,19 @@ def generate_dataset(font_path="./fonts/arial.ttf",
 
     os.makedirs(output_dir, exist_ok=True)
 
-    try:
-        font = ImageFont.truetype(font_path, font_size)
-    except Exception as e:
-        raise RuntimeError(f"Font not found or invalid: {font_path}\n{e}")
-
-    for char in charset:
-        for i in range(samples_per_char):
-            img = Image.new("L", (img_size, img_size), color=255)
-            draw = ImageDraw.Draw(img)
-            w, h = draw.textsize(char, font=font)
-            draw.text(((img_size - w) / 2, (img_size - h) / 2), char, font=font, fill=0)
-
-            # Augmentations
-            angle = random.uniform(-5, 5)
-            img = img.rotate(angle, fillcolor=255)
-
-            scale = random.uniform(0.85, 1.15)
-            new_size = int(img_size * scale)
-            img = img.resize((new_size, new_size), Image.LANCZOS)
-            canvas = Image.new("L", (img_size, img_size), color=255)
-            offset = ((img_size - new_size) // 2, (img_size - new_size) // 2)
-            canvas.paste(img, offset)
-            img = canvas
-
-            if random.random() < 0.5:
-                img = img.filter(ImageFilter.GaussianBlur(radius=random.uniform(0.7, 1.2)))
-
-            if random.random() < 0.6:
-                arr = np.array(img, dtype=np.uint8)
-                noise = np.random.randint(0, 20, arr.shape, dtype=np.uint8)
-                arr = np.clip(arr + noise, 0, 255)
-                img = Image.fromarray(arr)
-
+    # Base glyphs are rendered once in the parent (or loaded from the
+    # cache) so workers only do augmentation; a bad font fails fast here
+    glyphs = _load_glyphs(font_path, font_size, img_size, charset, glyph_cache_dir)
 
-            safe_char = char if char.isalnum() else f"sym_{ord(char)}"
-            filename = f"{safe_char}_{i}.png"
-            img.save(os.path.join(output_dir, filename))
+    # Each character is an independent job; spread them across all cores
+    n = len(charset)
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                             initializer=_init_worker) as executor:
+        total = sum(executor.map(_render_char, charset,
+                                 [glyphs[c] for c in charset],
+                                 [samples_per_char] * n, [output_dir] * n))
 
-    print(f"✅ Generated {len(charset) * samples_per_char} character images in '{output_dir}'")
+    print(f"✅ Generated {total} character images in '{output_dir}'")
 
 
 if __name__ == "__main__":